@@ -11,25 +11,6 @@ from pyptx.units import Inch, Auto # type: ignore
 import polars as pl
 
 
-# def margins(root: Area,
-#     size: Size = Inch(0.5),
-#     axis: Literal['horizontal', 'vertical'] = 'horizontal'
-# ) -> LayoutItem:
-#     if axis == 'horizontal':
-#         parent = root.add(Row())
-#     elif axis == 'vertical':
-#         parent = root.add(Column())
-
-#     parent.add(Box(size))
-#     inner = parent.add(Box())
-#     parent.add(Box(size))
-#     return inner
-
-# def slide_default(root: LayoutItem) -> LayoutItem:
-#     center = margins(root,Inch(0.5), 'horizontal')
-#     content = margins(center,Inch(0.5), 'vertical')
-#     return content
-
 def test_draw_rects(filename: str = "demo.pptx") -> None:
     prs = Presentation()
     root = SlideRoot(prs)
@@ -59,24 +40,6 @@ def test_draw_rects(filename: str = "demo.pptx") -> None:
     tbl = box1.add_table(df)
 
 
-    # content = slide_default(root)
-    # col = content.add(Column())
-    # col.add(Box(Ratio(0.1)))
-    # row = col.add(Row())
-    # img = row.add(Box(Weight(2)))
-    # text = row.add(Box(Weight(1)))
-
-    # row.add_box(Ratio(0.3))
-    # col = row.add(Column(Ratio(0.5)))
-    # col.add(Box(Inch(0.5)))
-    # inside = col.add(Row())
-    # box1 = inside.add(Box(Weight(2)))
-    # box2 = inside.add(Box())
-    # col.add(Box(Inch(0.5)))
-
-    # row.add_box()                      # defaults to Weight(1)
-
-
     root.prs.save(filename)
     print("saved", filename)
 
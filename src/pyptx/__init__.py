@@ -2,11 +2,11 @@
 pyptx – flex-style layout helper for python-pptx.
 """
 from .errors import *
-from .units import Inch, Centimeter, Ratio, Auto, resolve_length_span
+from .units import Inch, Centimeter, Ratio, Auto, AUTO, resolve_length_span
 from .layout import Rect, Area,  SlideRoot
 
 
 __all__ = [
-    "Inch", "Centimeter", "Ratio", "Auto", "resolve_length_span",
+    "Inch", "Centimeter", "Ratio", "Auto", "AUTO", "resolve_length_span",
     "Rect", "Area",  "SlideRoot",
 ]
@@ -1,49 +1,97 @@
-import polars as pl
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
 from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_PARAGRAPH_ALIGNMENT
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.table import _Cell
+from pptx.text.text import _Paragraph
 from pptx.util import Pt
 
+from .units import EMUS_PER_PT
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Single-spaced line height as a multiple of the font size.
+_LINE_SPACING = 1.2
+# Rough average glyph advance as a multiple of the font size.
+_CHAR_WIDTH = 0.6
+
 class Table:
     def __init__(self, df: pl.DataFrame, frame: GraphicFrame) -> None:
         self.df = df
         self._frame = frame
         self._table = frame.table
+        self._grid = [list(row.cells) for row in self._table.rows]
 
         self._write_header()
         self._write_data()
-        for cell in self._table.iter_cells():
-            self._format_cell(cell)
+
+        # Resolve the python-pptx proxies once; formatting and font sizing reuse them.
+        self._cells = [cell for row in self._grid for cell in row]
+        self._paragraphs = [cell.text_frame.paragraphs[0] for cell in self._cells]
+        self._runs = [paragraph.runs[0] for paragraph in self._paragraphs]
+        for cell, paragraph in zip(self._cells, self._paragraphs):
+            self._format_cell(cell, paragraph)
 
         self._auto_fontsize()
 
 
-    def _write_header(self):
-        for ci, hdr in enumerate(self.df.columns):
-            self._table.cell(0,ci).text = str(hdr)
+    def _write_header(self) -> None:
+        for cell, hdr in zip(self._grid[0], self.df.columns):
+            cell.text = str(hdr)
 
-    def _write_data(self):
-        for ri, row in enumerate(self.df.iter_rows(named = False), 1):
-            for ci, val in enumerate(row):
-                self._table.cell(ri, ci).text = str(val)
+    def _write_data(self) -> None:
+        for cells, row in zip(self._grid[1:], self.df.rows()):
+            for cell, val in zip(cells, row):
+                cell.text = str(val)
 
 
-    def _format_cell(self,cell: _Cell):
+    def _format_cell(self, cell: _Cell, paragraph: _Paragraph) -> None:
         cell.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-        cell.text_frame.paragraphs[0].alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-
-    def _auto_fontsize(self, max_size: float=40, min_size:float=1, step:float = 1):
-        font_size = max_size
-        prev_size = None
-
-        while font_size >= min_size:
-            for cell in self._table.iter_cells():
-                run = cell.text_frame.paragraphs[0].runs[0]
-                run.font.size = Pt(font_size)
-
-            # Refresh layout
-            current_height = self._frame.height
-            if prev_size == current_height:
-                break
-            prev_size = current_height
-            font_size -= step
+        paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
+
+    def _font_upper_bound(self) -> float:
+        """Largest font size (pt) for which the longest text fits on one line of its cell."""
+        cell = self._cells[0]
+        row_height = self._frame.height / len(self._grid) - cell.margin_top - cell.margin_bottom
+        bound = row_height / (_LINE_SPACING * EMUS_PER_PT)
+        columns = self._table.columns
+        for col, cells in enumerate(zip(*self._grid)):
+            longest = max(len(c.text) for c in cells)
+            if not longest:
+                continue
+            col_width = columns[col].width - cell.margin_left - cell.margin_right
+            bound = min(bound, col_width / (longest * _CHAR_WIDTH * EMUS_PER_PT))
+        return bound
+
+    def _auto_fontsize(self, max_size: float=40, min_size:float=1, step:float = 1) -> None:
+        """Pick the largest font size on the step grid that keeps the frame height."""
+        fonts = [run.font for run in self._runs]
+        # No size above the one-line-per-cell bound can fit, so never search past it.
+        max_size = max(min_size, min(max_size, self._font_upper_bound()))
+
+        def set_size(size: float) -> None:
+            pt = Pt(size)
+            for font in fonts:
+                font.size = pt
+
+        target_height = self._frame.height
+        lo, hi = 0, int((max_size - min_size) // step)
+        # python-pptx does not reflow the frame, so the largest size usually fits outright.
+        set_size(min_size + hi * step)
+        if self._frame.height <= target_height:
+            return
+
+        applied = hi
+        hi -= 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            set_size(min_size + mid * step)
+            applied = mid
+            if self._frame.height <= target_height:
+                lo = mid
+            else:
+                hi = mid - 1
+        if applied != lo:
+            set_size(min_size + lo * step)
@@ -2,6 +2,11 @@
 
 from loguru import logger
 
+__all__ = [
+    "PyptxError", "PPTXError", "LayoutError", "OverflowError",
+    "LayoutStateError", "SpecMismatchError",
+]
+
 class PyptxError(Exception):
     """Base error for pyptx operations."""
     def __init__(self, message: str):
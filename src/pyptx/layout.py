@@ -1,57 +1,104 @@
 """
-Core layout engine – per‑child units, one shared add_box().
+Core layout engine – areas split into per-child lengths on a SlideRoot.
 """
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Generator, List, Optional, Literal, Sequence
+from itertools import accumulate
+from typing import TYPE_CHECKING, Generator, Iterable, List, Optional, Literal, Sequence, final
 
 from loguru import logger
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.presentation import Presentation
 from pptx.util import Emu, Pt
-import polars as pl
 
 from .errors import LayoutError, LayoutStateError, PPTXError, SpecMismatchError
-from .units import Size, Auto, resolve_length_span
-from .content import Table
+from .units import AUTO, Size, resolve_length_span
 
+if TYPE_CHECKING:
+    # polars is heavy to import; content.py is only loaded when a table is added.
+    import polars as pl
+    from .content import Table
 
-@dataclass(slots=True)
+
+# Split axis index: 0 lays children out along x, 1 along y.
+_HORIZONTAL = 0
+_VERTICAL = 1
+_AXIS_NAMES: tuple[Literal["horizontal"], Literal["vertical"]] = ("horizontal", "vertical")
+_SPLIT_AXES: dict[str, int] = {
+    "horizontal": _HORIZONTAL, "h": _HORIZONTAL,
+    "vertical": _VERTICAL, "v": _VERTICAL,
+}
+
+
+@final
 class Rect:
     """A rectangle in EMUs with position and size."""
-    x: Emu
-    y: Emu
-    width: Emu
-    height: Emu
-
-    def split_horizontal(self, lengths: List[Size]) -> list[Rect]:
-        widths = resolve_length_span(lengths, self.width)
-        out: list[Rect] = []
-        cursor = self.x
-        for w in widths:
-            out.append(Rect(Emu(cursor), self.y, w, self.height))
-            cursor += w
-        return out
-
-    def split_vertical(self, lengths: List[Size]) -> List[Rect]:
-        heights = resolve_length_span(lengths, self.height)
-        out: list[Rect] = []
-        cursor = self.y
-        for h in heights:
-            out.append(Rect(self.x, Emu(cursor), self.width, h))
-            cursor += h
-        return out
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x: Emu, y: Emu, width: Emu, height: Emu) -> None:
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rect):
+            return NotImplemented
+        return (self.x == other.x and self.y == other.y
+                and self.width == other.width and self.height == other.height)
+
+    def __repr__(self) -> str:
+        return f"Rect(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+    def split(self, axis: int, lengths: Iterable[Optional[Size]], default: Optional[Size] = AUTO) -> List[Rect]:
+        """Split along x (axis 0) or y (axis 1) into consecutive rects."""
+        sizes = resolve_length_span(lengths, (self.width, self.height)[axis], default)
+        # One offset more than there are sizes; zip drops the trailing end edge.
+        offsets = accumulate(sizes, initial=(self.x, self.y)[axis])
+        if axis == _HORIZONTAL:
+            y, height = self.y, self.height
+            return [Rect(Emu(x), y, w, height) for x, w in zip(offsets, sizes)]
+        x, width = self.x, self.width
+        return [Rect(x, Emu(y), width, h) for y, h in zip(offsets, sizes)]
+
+    def split_horizontal(self, lengths: Iterable[Optional[Size]], default: Optional[Size] = AUTO) -> List[Rect]:
+        return self.split(_HORIZONTAL, lengths, default)
+
+    def split_vertical(self, lengths: Iterable[Optional[Size]], default: Optional[Size] = AUTO) -> List[Rect]:
+        return self.split(_VERTICAL, lengths, default)
 
 class Area:
     """A layout box that can be split vertically or horizontally."""
+    __slots__ = ("children", "_rect", "_length", "_parent", "_parent_pos", "_root", "_pos", "_depth", "_dirty", "_axis", "_child_lengths")
 
     def __init__(self, length: Optional[Size] = None) -> None:
         self.children: List[Area] = []
         self._rect: Optional[Rect] = None
-        self.length: Optional[Size] = length
+        self._length: Optional[Size] = length
         self._parent: Optional[Area] = None
-        self.split_direction: Optional[Literal["vertical", "horizontal", "v", "h"]] = None
+        self._parent_pos: int = 0
+        self._root: Optional[SlideRoot] = None
+        self._pos: Optional[tuple[int, ...]] = None
+        self._depth: int = 1
+        self._dirty: bool = True
+        self._axis: Optional[int] = None
+        self._child_lengths: Optional[tuple[Optional[Size], ...]] = None
+
+    @property
+    def length(self) -> Optional[Size]:
+        return self._length
+
+    @length.setter
+    def length(self, value: Optional[Size]) -> None:
+        self._length = value
+        if self._parent is not None:
+            self._parent._child_lengths = None
+            self._parent._mark_dirty()
+
+    @property
+    def split_direction(self) -> Optional[Literal["horizontal", "vertical"]]:
+        return None if self._axis is None else _AXIS_NAMES[self._axis]
 
     @property
     def rect(self) -> Rect:
@@ -67,25 +114,26 @@ class Area:
 
     @property
     def root(self) -> SlideRoot:
-        *_, last = self.walk_up()
-        if isinstance(last, SlideRoot):
-            return last
-        raise LayoutStateError("No SlideLayout root found in hierarchy")
+        if self._root is None:
+            raise LayoutStateError("No SlideRoot found in hierarchy")
+        return self._root
 
     @property
     def parent_pos(self) -> int:
         """Get index of current area in siblings."""
-        return self.parent.children.index(self)
+        if self._parent is None:
+            raise LayoutStateError("Box has no parent")
+        return self._parent_pos
 
     @property
     def pos(self) -> tuple[int,...]:
         """Get list of indicies from slideroot."""
-        idx: list[int] = []
-        for level in self.walk_up():
-            if isinstance(level, SlideRoot):
-                break
-            idx.append(level.parent_pos)
-        return tuple(idx[::-1])
+        if self._pos is None:
+            if isinstance(self, SlideRoot):
+                self._pos = ()
+            else:
+                self._pos = self.parent.pos + (self.parent_pos,)
+        return self._pos
 
     def _get_child(self, index: int) -> Area:
         if index < 0 or index >= len(self.children):
@@ -95,70 +143,115 @@ class Area:
     def __getitem__(self, index: int|Sequence[int]) -> Area:
         if isinstance(index, int):
             return self._get_child(index)
-        elif len(index) == 0:
-            return self
-        else:
-            return self._get_child(index[0])[index[1:]]
+        node = self
+        for i in index:
+            node = node._get_child(i)
+        return node
 
     def add_child(self, item: Area) -> Area:
         item._parent = self
+        item._parent_pos = len(self.children)
         self.children.append(item)
+        self._child_lengths = None
+        # Root, position and depth are cached per area; refresh them for the attached subtree.
+        item._root = self._root
+        item._pos = None
+        item._depth = self._depth + 1
+        if item.children:
+            for node in item.walk():
+                node._root = self._root
+                node._pos = None
+                if node is not item:
+                    node._depth = node.parent._depth + 1
+        self._mark_dirty()
         return item
 
+    def _mark_dirty(self) -> None:
+        """Invalidate cached layout for this area and its ancestors."""
+        node: Optional[Area] = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node = node._parent
+
     def walk(self) -> Generator[Area]:
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        """Yield this area and all descendants in pre-order."""
+        stack: List[Area] = [self]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            yield node
+            extend(reversed(node.children))
 
     def walk_up(self) -> Generator[Area]:
-        yield self
-        if isinstance(self, SlideRoot):
-            return
-        yield from self.parent.walk_up()
-
-    def layout(self, rect: Rect):
-        logger.debug(f"{len(list(self.walk_up()))} - {rect}")
-        self._rect = rect
-        self._layout_children()
-
-    def _layout_children(self):
-        if self.split_direction == "vertical":
-            lengths = [child.length or Auto(1) for child in self.children]
-            rects = self.rect.split_vertical(lengths)
-        elif self.split_direction == "horizontal":
-            lengths = [child.length or Auto(1) for child in self.children]
-            rects = self.rect.split_horizontal(lengths)
-        else:
-            return
-        for child, rect in zip(self.children, rects):
-            child.layout(rect)
+        """Yield this area and each ancestor up to the top of the tree."""
+        node: Optional[Area] = self
+        while node is not None:
+            yield node
+            node = node._parent
+
+    def layout(self, rect: Rect) -> None:
+        """Lay out this area and its subtree in one iterative pass."""
+        stack: List[tuple[Area, Rect]] = [(self, rect)]
+        pop, extend = stack.pop, stack.extend
+        node = self
+        try:
+            while stack:
+                node, rect = pop()
+                # Subtree is unchanged since the last pass and gets the same rect.
+                if not node._dirty and node._rect == rect:
+                    continue
+                logger.debug("{} - {}", node._depth, rect)
+                node._rect = rect
+                rects = node._layout_children(rect)
+                node._dirty = False
+                extend(zip(reversed(node.children), reversed(rects)))
+        except Exception:
+            # Keep the failed area and its ancestors dirty so the next pass retries them.
+            failed: Optional[Area] = node
+            while failed is not None:
+                failed._dirty = True
+                failed = failed._parent
+            raise
+
+    def _layout_children(self, rect: Rect) -> List[Rect]:
+        """Return the rect for each child; layout() drives the descent."""
+        if self._axis is None:
+            return []
+        lengths = self._child_lengths
+        if lengths is None:
+            lengths = self._child_lengths = tuple(child._length for child in self.children)
+        return rect.split(self._axis, lengths)
 
     def _apply_split(self, lengths: List[Size], direction: Literal["vertical", "horizontal", "v", "h"]) -> List[Area]:
-        if direction.lower() in ['vertical','v']:
-            direction = 'vertical'
-        elif direction.lower() in ['horizontal','h']:
-            direction = 'horizontal'
-        else:
+        axis = _SPLIT_AXES.get(direction.lower())
+        if axis is None:
             raise LayoutError(f"Split must be 'horizontal' or 'vertical', not: {direction}")
 
         if not lengths:
-            raise SpecMismatchError(f"Must provide at least one {direction} length")
-
-        self.children = []
-        for l in lengths:
-            self.add_child(Area(l))
-        self.split_direction = direction
-        return self.children
+            raise SpecMismatchError(f"Must provide at least one {_AXIS_NAMES[axis]} length")
+
+        # Fresh leaves have no subtree, so wire them up here instead of via add_child().
+        self.children = children = [Area(l) for l in lengths]
+        root, depth = self._root, self._depth + 1
+        for i, child in enumerate(children):
+            child._parent = self
+            child._parent_pos = i
+            child._root = root
+            child._depth = depth
+        self._child_lengths = tuple(lengths)
+        self._axis = axis
+        self._mark_dirty()
+        return children
 
     def split_vertical(self, lengths: List[Size]) -> List[Area]:
-        """Split this box into columns (children) with given widths."""
+        """Split this box into rows (children) with given heights."""
         return self._apply_split(lengths, "vertical")
 
     def split_horizontal(self, lengths: List[Size]) -> List[Area]:
-        """Split this box into rows (children) with given heights."""
+        """Split this box into columns (children) with given widths."""
         return self._apply_split(lengths, "horizontal")
 
-    def debug_rect(self, text: str|None=None):
+    def debug_rect(self, text: str|None=None) -> None:
         self.root.draw_rect(self.rect)
         if text:
            self.root.text(self.rect, f"{self.pos} - {text}")
@@ -169,23 +262,42 @@ class Area:
         return self.root.table(self.rect, df)
 
 # Root container ----------------------------------------------------
+# Same markup python-pptx emits for add_shape(MSO_SHAPE.RECTANGLE) plus fill/line.
+_RECT_SP_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rectangle {num}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>{fill}'
+    '<a:ln w="{line_width}"><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    '</p:sp>'
+)
+_SOLID_FILL_XML = '<a:solidFill><a:srgbClr val="{}"/></a:solidFill>'
+
 class SlideRoot(Area):
+    __slots__ = ("prs", "_slide", "slide_width", "slide_height")
+
     def __init__(self, prs: Presentation) -> None:
+        # Each read parses sldSz; python-pptx returns None when it is missing.
+        slide_width, slide_height = prs.slide_width, prs.slide_height
+        if slide_width is None:
+            raise PPTXError(f"Unknown slide_width: {slide_width}")
+        if slide_height is None:
+            raise PPTXError(f"Unknown slide_height: {slide_height}")
+
         super().__init__()
+        self._root = self
         self.prs = prs
+        self.slide_width = Emu(slide_width)
+        self.slide_height = Emu(slide_height)
         # TODO better logic to find/create empty slide by default
         self._slide = prs.slides.add_slide(prs.slide_layouts[6])
 
-        if not isinstance(prs.slide_width, int):
-            raise PPTXError(f"Unknown slide_width: {prs.slide_width}")
-        if not isinstance(prs.slide_height, int):
-            raise PPTXError(f"Unknown slide_height: {prs.slide_height}")
-
-        self.slide_width = Emu(prs.slide_width)
-        self.slide_height = Emu(prs.slide_height)
-
     def resolve(self) -> None:
-        super().layout(Rect(Emu(0), Emu(0), self.slide_width, self.slide_height))
+        self.layout(Rect(Emu(0), Emu(0), self.slide_width, self.slide_height))
 
     def draw_rect(self,
         rect: Rect,
@@ -194,21 +306,45 @@ class SlideRoot(Area):
         line: str = "FF0000",
         line_width: int | Pt = 1
     ) -> None:
-        shape = self._slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, rect.x, rect.y, rect.width, rect.height
-        )
-        if fill:
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = RGBColor.from_string(fill)
-        shape.line.color.rgb = RGBColor.from_string(line)
-        shape.line.width = line_width if isinstance(line_width, Pt) else Pt(line_width)
+        self.draw_rects([rect], fill=fill, line=line, line_width=line_width)
 
+    def draw_rects(self,
+        rects: Sequence[Rect],
+        *,
+        fill: Optional[str] = None,
+        line: str = "FF0000",
+        line_width: int | Pt = 1
+    ) -> None:
+        """Draw many rectangles with a single XML parse instead of one add_shape each."""
+        if not rects:
+            return
+        fill_xml = _SOLID_FILL_XML.format(RGBColor.from_string(fill)) if fill else ""
+        line = str(RGBColor.from_string(line))
+        width = line_width if isinstance(line_width, Pt) else Pt(line_width)
+
+        # python-pptx has no public batch API; _next_shape_id is what its own
+        # add_shape() uses to number new shapes.
+        first_id = self._slide.shapes._next_shape_id
+        sps = "".join(
+            _RECT_SP_XML.format(
+                id=shape_id, num=shape_id - 1,
+                x=rect.x, y=rect.y, cx=rect.width, cy=rect.height,
+                fill=fill_xml, line=line, line_width=int(width),
+            )
+            for shape_id, rect in enumerate(rects, first_id)
+        )
+        batch = parse_xml(f"<p:spTree {nsdecls('a', 'p')}>{sps}</p:spTree>")
+        sp_tree = self._slide.shapes._spTree
+        # Shapes must precede <p:extLst>, same as python-pptx's add_autoshape().
+        for sp in list(batch):
+            sp_tree.insert_element_before(sp, "p:extLst")
 
     def text(self, rect: Rect, text: str) -> None:
         shape = self._slide.shapes.add_textbox( rect.x, rect.y, rect.width, rect.height)
         shape.text = text
 
     def table(self, rect: Rect, df: pl.DataFrame) -> Table:
+        from .content import Table
         rows = df.height+1
         cols = df.width
         gframe = self._slide.shapes.add_table(rows, cols, rect.x, rect.y, rect.width, rect.height)
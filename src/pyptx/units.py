@@ -4,9 +4,9 @@ Unit abstractions for specifying sizes in the layout engine.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Iterable, Optional
 
-from .errors import OverflowError
+from .errors import OverflowError, SpecMismatchError
 
 import pptx.util as _pptx_util
 from pptx.util import Emu
@@ -15,7 +15,20 @@ EMUS_PER_INCH = _pptx_util.Inches(1).emu
 EMUS_PER_CM = _pptx_util.Cm(1).emu
 EMUS_PER_PT = _pptx_util.Pt(1).emu
 
+# How resolve_length_span treats a Size: a length of its own, an absolute
+# length precomputed in EMUs, a fraction of the parent, or a share of what is left.
+_FIXED = 0
+_ABSOLUTE = 1
+_RATIO = 2
+_WEIGHT = 3
+_ZERO = Emu(0)
+
 class Size(ABC):
+    """A length spec. Treated as an immutable value: laid-out areas cache results
+    derived from it, so change an area's length by assigning a new Size."""
+    __slots__ = ()
+    _kind: int = _FIXED
+
     @abstractmethod
     def resolve(
         self,
@@ -26,50 +39,116 @@ class Size(ABC):
 
 
 class Inch(Size):
-    def __init__(self, inches: float): self.inches = float(inches)
+    # Read-only: the EMU value is derived once and must not drift from inches.
+    __slots__ = ("_inches", "_emu")
+    _kind = _ABSOLUTE
+
+    def __init__(self, inches: float) -> None:
+        self._inches = float(inches)
+        self._emu = Emu(int(self._inches * EMUS_PER_INCH))
+    @property
+    def inches(self) -> float: return self._inches
+    @property
+    def emu(self) -> Emu: return self._emu
     def resolve(self, parent_size_emu: Emu, available_space_emu: Emu, total_weights: float) -> Emu:
-        return Emu(int(self.inches * EMUS_PER_INCH))
-    def __repr__(self): return f"Inch({self.inches})"
+        return self._emu
+    def __repr__(self) -> str: return f"Inch({self._inches})"
 
 
 class Centimeter(Size):
-    def __init__(self, cm: float): self.cm = float(cm)
+    # Read-only: the EMU value is derived once and must not drift from cm.
+    __slots__ = ("_cm", "_emu")
+    _kind = _ABSOLUTE
+
+    def __init__(self, cm: float) -> None:
+        self._cm = float(cm)
+        self._emu = Emu(int(self._cm * EMUS_PER_CM))
+    @property
+    def cm(self) -> float: return self._cm
+    @property
+    def emu(self) -> Emu: return self._emu
     def resolve(self, parent_size_emu: Emu, available_space_emu: Emu, total_weights: float) -> Emu:
-        return Emu(int(self.cm * EMUS_PER_CM))
-    def __repr__(self): return f"Centimeter({self.cm})"
+        return self._emu
+    def __repr__(self) -> str: return f"Centimeter({self._cm})"
 
 
 class Ratio(Size):
-    def __init__(self, ratio: float):
+    # Read-only, like every unit: laid-out areas cache geometry derived from it.
+    __slots__ = ("_ratio",)
+    _kind = _RATIO
+
+    def __init__(self, ratio: float) -> None:
         if not 0 <= ratio <= 1:
             raise ValueError("Ratio must be between 0 and 1")
-        self.ratio = float(ratio)
+        self._ratio = float(ratio)
+    @property
+    def ratio(self) -> float: return self._ratio
     def resolve(self, parent_size_emu: Emu, available_space_emu: Emu, total_weights: float) -> Emu:
-        return Emu(int(parent_size_emu * self.ratio))
-    def __repr__(self): return f"Ratio({self.ratio})"
+        return Emu(int(parent_size_emu * self._ratio))
+    def __repr__(self) -> str: return f"Ratio({self._ratio})"
 
 
 class Auto(Size):
-    def __init__(self, weight: float = 1.0):
+    # Read-only, like every unit: laid-out areas cache geometry derived from it.
+    __slots__ = ("_weight",)
+    _kind = _WEIGHT
+
+    def __init__(self, weight: float = 1.0) -> None:
         if weight <= 0: raise ValueError
-        self.weight = float(weight)
+        self._weight = float(weight)
+    @property
+    def weight(self) -> float: return self._weight
     def resolve(self, parent_size_emu: Emu, available_space_emu: Emu, total_weights: float) -> Emu:
         if total_weights <= 0: raise ValueError("total_weights must be > 0")
-        return Emu(int(available_space_emu * (self.weight / total_weights)))
-    def __repr__(self): return f"Weight({self.weight})"
+        return Emu(int(available_space_emu * (self._weight / total_weights)))
+    def __repr__(self) -> str: return f"Auto({self._weight})"
 
 
-def resolve_length_span(specs: Sequence[Size], total_emu: Emu) -> list[Emu]:
-    total_fixed = Emu(0)
-    total_w = 0.0
+# Shared Auto(1); used wherever a length is left unspecified.
+AUTO = Auto()
+
+
+def resolve_length_span(
+    specs: Iterable[Optional[Size]], total_emu: int, default: Optional[Size] = AUTO
+) -> list[Emu]:
+    """Resolve specs to EMU lengths in one pass; missing specs take ``default``."""
+    fixed: list[Emu] = []
+    weights: list[float] = []
     for s in specs:
-        if isinstance(s, Auto):
-            total_w += s.weight
+        s = s or default
+        if s is None:
+            raise SpecMismatchError("Missing length and no default given")
+        kind = s._kind
+        if kind == _ABSOLUTE:
+            fixed.append(s._emu)  # type: ignore[attr-defined]
+            weights.append(0.0)
+        elif kind == _WEIGHT:
+            fixed.append(_ZERO)
+            weights.append(s._weight)  # type: ignore[attr-defined]
+        elif kind == _RATIO:
+            fixed.append(Emu(int(total_emu * s._ratio)))  # type: ignore[attr-defined]
+            weights.append(0.0)
         else:
-            total_fixed += s.resolve(total_emu, Emu(0), Emu(0))
+            fixed.append(s.resolve(Emu(total_emu), _ZERO, 0.0))
+            weights.append(0.0)
+    return _distribute_span(fixed, weights, total_emu)
 
-    avail = total_emu - total_fixed
+
+def _distribute_span(fixed: list[Emu], weights: list[float], total_emu: int) -> list[Emu]:
+    """Share the space left after fixed lengths between weighted slots."""
+    avail = total_emu - sum(fixed)
     if avail < 0:
         raise OverflowError("Specified lengths exceed parent size")
 
-    return [s.resolve(total_emu, Emu(avail), total_w) for s in specs]
+    # A plain running total, not sum(): sum() compensates float rounding and
+    # can shift a share by one EMU against the layouts produced so far.
+    total_w = 0.0
+    for w in weights:
+        total_w += w
+    if not total_w:
+        # Only fixed lengths: the values resolved while marshalling are the result.
+        return fixed
+    if len(set(weights)) == 1:
+        # Only equal weights (including a single Auto): every slot gets the same share.
+        return [Emu(int(avail * (weights[0] / total_w)))] * len(weights)
+    return [Emu(int(avail * (w / total_w))) if w else f for f, w in zip(fixed, weights)]